@@ -8,48 +8,97 @@ Features a beautiful Solarpunk aesthetic - rusty-futuristic with sustainable tec
 
 import os
 import json
-import tempfile
+import re
+import functools
+import hashlib
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import ttk, scrolledtext, messagebox
 from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import IntEnum
 import threading
-import sys
+import queue
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
 
-# Try to import PIL, fall back gracefully if not available
+# Prefer orjson for reading and writing level files, fall back to the standard library
 try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PIL_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
-# Try to import janus_swi for better Prolog integration
-try:
-    import janus_swi as janus
 
-    JANUS_AVAILABLE = True
-except ImportError:
-    JANUS_AVAILABLE = False
-    print("Warning: janus_swi not available. Install with: pip install janus_swi")
+@functools.lru_cache(maxsize=None)
+def _get_janus():
+    """Import janus_swi on first use, returning None if it is not available"""
+    try:
+        import janus_swi
+    except ImportError:
+        print("Warning: janus_swi not available. Install with: pip install janus_swi")
+        return None
+    return janus_swi
+
+
+# Resized photos keyed by (path, size); must only be filled once a Tk root exists
+_IMG_CACHE: Dict[Tuple[str, Tuple[int, int]], Any] = {}
+
+
+def _load_photo(path: str, size: Tuple[int, int]):
+    """Load an image resized to the given size as a Tk photo (imports PIL lazily)"""
+    key = (path, size)
+    photo = _IMG_CACHE.get(key)
+    if photo is not None:
+        return photo
+
+    from PIL import Image, ImageTk
+
+    image = Image.open(path)
+    image = image.resize(size, Image.Resampling.BILINEAR)
+    photo = _IMG_CACHE[key] = ImageTk.PhotoImage(image)
+    return photo
+
 
+class GameResult(IntEnum):
+    SUCCESS = 0
+    SYNTAX_ERROR = 1
+    WRONG_RESULTS = 2
+    PROLOG_ERROR = 3
 
-class GameResult(Enum):
-    SUCCESS = "success"
-    SYNTAX_ERROR = "syntax_error"
-    WRONG_RESULTS = "wrong_results"
-    PROLOG_ERROR = "prolog_error"
 
+# Spots Prolog variable tokens (an uppercase letter or underscore starting a name) in a query string
+_HAS_VAR = re.compile(r'(?<![A-Za-z0-9_])[A-Z_]').search
 
-@dataclass
+
+@dataclass(slots=True)
 class Query:
     """Represents a Prolog query with expected results"""
     query: str
     expected: List[str]
     description: str = ""
+    _expected_set: frozenset = field(init=False, repr=False, compare=False)
+    _expects_failure: bool = field(init=False, repr=False, compare=False)
+    _has_vars: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Precomputed once so run_queries doesn't rebuild them on every test
+        self._expected_set = frozenset(map(str, self.expected or ()))
+        self._expects_failure = not self.expected or self.expected == ['false']
+        self._has_vars = bool(_HAS_VAR(self.query))
+
+
+@dataclass(slots=True)
+class QueryResult:
+    """Outcome of running a single query against the player's code"""
+    query: str
+    expected: List[str]
+    actual: List[str]
+    correct: bool
+    error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Level:
     """Represents a game level with law implementation challenge"""
     id: str
@@ -64,6 +113,33 @@ class Level:
     solution: List[str] = None
 
 
+# Janus truth markers that are not real variable bindings
+_SKIP_VALUES = frozenset((True, False, 'True', 'False', None, 'None'))
+_SKIP_STRS = frozenset(('True', 'False', 'None'))
+
+
+def _is_binding(value) -> bool:
+    """Check whether a Janus answer value is an actual binding rather than a truth marker"""
+    try:
+        return value not in _SKIP_VALUES and str(value) not in _SKIP_STRS
+    except TypeError:
+        # Unhashable values (e.g. Prolog lists) are always real bindings
+        return True
+
+
+# Separator line used in the compliance report
+_RULE = '=' * 50
+
+# Maximum number of test results remembered per session
+RESULT_CACHE_SIZE = 256
+
+# Difficulty icons for the level list, indexed by difficulty (clamped to 0-5)
+_DIFF_ICONS = tuple('☀️' * d for d in range(6))
+
+# Parsed levels keyed by filepath, holding the file mtime (in ns) they were parsed at
+_LEVEL_CACHE: Dict[str, Tuple[int, Level]] = {}
+
+
 # Updated GUI text elements with cleaner Star Trek + Solarpunk styling
 GUI_TEXT = {
     'app_title': "LAW MAKER",
@@ -95,84 +171,69 @@ class SolarpunkTheme:
     """Solarpunk theme colors and styles - rusty-futuristic aesthetic"""
 
     # Color palette inspired by Star Trek LCARS + natural elements
-    COLORS = {
-        'bg_primary': '#0A0E1A',  # Deep space blue-black
-        'bg_secondary': '#1B2B35',  # Dark teal
-        'bg_panel': '#2A4A5A',  # Medium blue-gray
-        'bg_input': '#0F1419',  # Very dark blue
-        'accent_primary': '#00D4AA',  # Bright teal (Star Trek-ish)
-        'accent_secondary': '#66B2FF',  # Bright blue
-        'accent_tertiary': '#FFB366',  # Warm orange
-        'accent_success': '#00FF88',  # Bright green
-        'text_primary': '#E8F4F8',  # Very light blue-white
-        'text_secondary': '#B8D4E8',  # Light blue
-        'text_accent': '#00D4AA',  # Matching accent
-        'warning': '#FF6B35',  # Orange-red
-        'success': '#00FF88',  # Bright green
-        'border': '#4A6FA5',  # Medium blue
-        'hover': '#3A5F85'  # Hover blue
-    }
+    COLORS = SimpleNamespace(
+        bg_primary='#0A0E1A',  # Deep space blue-black
+        bg_secondary='#1B2B35',  # Dark teal
+        bg_panel='#2A4A5A',  # Medium blue-gray
+        bg_input='#0F1419',  # Very dark blue
+        accent_primary='#00D4AA',  # Bright teal (Star Trek-ish)
+        accent_secondary='#66B2FF',  # Bright blue
+        accent_tertiary='#FFB366',  # Warm orange
+        accent_success='#00FF88',  # Bright green
+        text_primary='#E8F4F8',  # Very light blue-white
+        text_secondary='#B8D4E8',  # Light blue
+        text_accent='#00D4AA',  # Matching accent
+        warning='#FF6B35',  # Orange-red
+        success='#00FF88',  # Bright green
+        border='#4A6FA5',  # Medium blue
+        hover='#3A5F85'  # Hover blue
+    )
 
     @staticmethod
     def configure_style():
         """Configure ttk styles with Star Trek + Solarpunk fusion theme"""
         style = ttk.Style()
+        C = SolarpunkTheme.COLORS
+        bg = C.bg_primary
+        accent = C.accent_primary
+
+        style_spec = [
+            # Main frame styles
+            ('Solarpunk.TFrame', dict(background=bg, relief='flat')),
+            ('Panel.TFrame', dict(background=C.bg_panel, relief='ridge', borderwidth=1)),
+
+            # Label styles
+            ('Solarpunk.TLabel', dict(background=bg, foreground=C.text_primary,
+                                      font=('Helvetica', 10))),
+            ('Title.TLabel', dict(background=bg, foreground=accent,
+                                  font=('Helvetica', 18, 'bold'))),
+            ('Header.TLabel', dict(background=bg, foreground=C.text_accent,
+                                   font=('Helvetica', 12, 'bold'))),
+
+            # Button styles - more Star Trek LCARS inspired
+            ('Solarpunk.TButton', dict(background=accent, foreground=bg,
+                                       font=('Helvetica', 10, 'bold'),
+                                       borderwidth=0, relief='flat', padding=(12, 6))),
+
+            # Notebook styles
+            ('Solarpunk.TNotebook', dict(background=bg, borderwidth=0)),
+            ('Solarpunk.TNotebook.Tab', dict(background=C.bg_secondary, foreground=C.text_secondary,
+                                             padding=[16, 8], font=('Helvetica', 10, 'bold'),
+                                             borderwidth=1)),
+        ]
+
+        style_map_spec = [
+            ('Solarpunk.TButton', dict(background=[('active', C.accent_secondary),
+                                                   ('pressed', C.accent_tertiary)])),
+            ('Solarpunk.TNotebook.Tab', dict(background=[('selected', accent),
+                                                         ('active', C.hover)],
+                                             foreground=[('selected', bg)])),
+        ]
 
-        # Main frame styles
-        style.configure('Solarpunk.TFrame',
-                        background=SolarpunkTheme.COLORS['bg_primary'],
-                        relief='flat')
-
-        style.configure('Panel.TFrame',
-                        background=SolarpunkTheme.COLORS['bg_panel'],
-                        relief='ridge',
-                        borderwidth=1)
-
-        # Label styles
-        style.configure('Solarpunk.TLabel',
-                        background=SolarpunkTheme.COLORS['bg_primary'],
-                        foreground=SolarpunkTheme.COLORS['text_primary'],
-                        font=('Helvetica', 10))
-
-        style.configure('Title.TLabel',
-                        background=SolarpunkTheme.COLORS['bg_primary'],
-                        foreground=SolarpunkTheme.COLORS['accent_primary'],
-                        font=('Helvetica', 18, 'bold'))
-
-        style.configure('Header.TLabel',
-                        background=SolarpunkTheme.COLORS['bg_primary'],
-                        foreground=SolarpunkTheme.COLORS['text_accent'],
-                        font=('Helvetica', 12, 'bold'))
-
-        # Button styles - more Star Trek LCARS inspired
-        style.configure('Solarpunk.TButton',
-                        background=SolarpunkTheme.COLORS['accent_primary'],
-                        foreground=SolarpunkTheme.COLORS['bg_primary'],
-                        font=('Helvetica', 10, 'bold'),
-                        borderwidth=0,
-                        relief='flat',
-                        padding=(12, 6))
-
-        style.map('Solarpunk.TButton',
-                  background=[('active', SolarpunkTheme.COLORS['accent_secondary']),
-                              ('pressed', SolarpunkTheme.COLORS['accent_tertiary'])])
-
-        # Notebook styles
-        style.configure('Solarpunk.TNotebook',
-                        background=SolarpunkTheme.COLORS['bg_primary'],
-                        borderwidth=0)
-
-        style.configure('Solarpunk.TNotebook.Tab',
-                        background=SolarpunkTheme.COLORS['bg_secondary'],
-                        foreground=SolarpunkTheme.COLORS['text_secondary'],
-                        padding=[16, 8],
-                        font=('Helvetica', 10, 'bold'),
-                        borderwidth=1)
-
-        style.map('Solarpunk.TNotebook.Tab',
-                  background=[('selected', SolarpunkTheme.COLORS['accent_primary']),
-                              ('active', SolarpunkTheme.COLORS['hover'])],
-                  foreground=[('selected', SolarpunkTheme.COLORS['bg_primary'])])
+        for name, options in style_spec:
+            style.configure(name, **options)
+        for name, options in style_map_spec:
+            style.map(name, **options)
 
         return style
 
@@ -189,14 +250,36 @@ class LevelLoader:
             LevelLoader.create_sample_levels(directory)
 
         try:
-            level_files = [f for f in os.listdir(directory) if f.endswith('.json')]
-            level_files.sort()
+            with os.scandir(directory) as it:
+                entries = sorted((e for e in it if e.is_file() and e.name.endswith('.json')),
+                                 key=lambda e: e.name)
+
+            # Forget cached levels whose files have been removed
+            current = {e.path for e in entries}
+            for path in [p for p in _LEVEL_CACHE if os.path.dirname(p) == directory and p not in current]:
+                LevelLoader.invalidate(path)
+
+            # Unchanged files come straight from the cache
+            mtimes = [e.stat().st_mtime_ns for e in entries]
+            loaded = [None] * len(entries)
+            misses = []
+            for i, (entry, mtime) in enumerate(zip(entries, mtimes)):
+                cached = _LEVEL_CACHE.get(entry.path)
+                if cached and cached[0] == mtime:
+                    loaded[i] = cached[1]
+                else:
+                    misses.append(i)
 
-            for filename in level_files:
-                filepath = os.path.join(directory, filename)
-                level = LevelLoader.load_level_from_file(filepath)
-                if level:
-                    levels.append(level)
+            # Parse new or changed files in parallel; map() keeps them in order
+            if misses:
+                with ThreadPoolExecutor(max_workers=min(8, len(misses))) as executor:
+                    parsed = executor.map(LevelLoader.load_level_from_file,
+                                          [entries[i].path for i in misses],
+                                          [mtimes[i] for i in misses])
+                    for i, level in zip(misses, parsed):
+                        loaded[i] = level
+
+            levels = [level for level in loaded if level]
 
         except Exception as e:
             print(f"Error loading levels: {e}")
@@ -205,11 +288,32 @@ class LevelLoader:
         return levels if levels else LevelLoader.get_sample_levels()
 
     @staticmethod
-    def load_level_from_file(filepath: str) -> Optional[Level]:
-        """Load a single level from a JSON file"""
+    def invalidate(path: Optional[str] = None):
+        """Drop cached levels so they are re-parsed (all of them if no path is given)"""
+        if path is None:
+            _LEVEL_CACHE.clear()
+        else:
+            _LEVEL_CACHE.pop(path, None)
+
+    @staticmethod
+    def cached_mtimes(directory: str) -> Dict[str, int]:
+        """Return the mtime each cached level file in a directory was parsed at"""
+        return {path: mtime for path, (mtime, _) in _LEVEL_CACHE.items()
+                if os.path.dirname(path) == directory}
+
+    @staticmethod
+    def load_level_from_file(filepath: str, mtime: Optional[int] = None) -> Optional[Level]:
+        """Load a single level from a JSON file (mtime may be passed in if already known)"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if mtime is None:
+                mtime = os.stat(filepath).st_mtime_ns
+            cached = _LEVEL_CACHE.get(filepath)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
             # Handle both nested and flat JSON structures
             if 'content' in data:
@@ -237,6 +341,7 @@ class LevelLoader:
                 solution=data.get('solution', [])
             )
 
+            _LEVEL_CACHE[filepath] = (mtime, level)
             return level
 
         except Exception as e:
@@ -275,8 +380,11 @@ class LevelLoader:
         }
 
         # Save level file
-        with open(os.path.join(directory, '01_student_meal_subsidy.json'), 'w') as f:
-            json.dump(level1_data, f, indent=2)
+        with open(os.path.join(directory, '01_student_meal_subsidy.json'), 'wb') as f:
+            if ORJSON_AVAILABLE:
+                f.write(orjson.dumps(level1_data, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(level1_data, indent=2).encode())
 
     @staticmethod
     def get_sample_levels() -> List[Level]:
@@ -302,22 +410,81 @@ class LevelLoader:
         return [level1]
 
 
+class ReportBuilder:
+    """Accumulates report text along with the line numbers to highlight"""
+
+    __slots__ = ('parts', 'tags', '_line')
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.tags: List[Tuple[int, str]] = []  # (line number, tag name)
+        self._line = 1
+
+    def add(self, text: str, tag: Optional[str] = None):
+        """Append text, optionally tagging the line it starts on"""
+        if tag:
+            self.tags.append((self._line, tag))
+        self.parts.append(text)
+        self._line += text.count('\n')
+
+    def text(self) -> str:
+        return "".join(self.parts)
+
+
 class JanusPrologRunner:
     """Enhanced Prolog runner using janus_swi for better integration"""
 
-    def __init__(self):
-        self.janus_available = JANUS_AVAILABLE
-        if self.janus_available:
-            try:
-                # Initialize janus_swi
-                janus.query_once("writeln('Prolog available!')")
-                self.prolog_available = True
-            except Exception as e:
-                print(f"Error initializing janus_swi: {e}")
-                self.prolog_available = False
-                self.janus_available = False
-        else:
+    __slots__ = ('janus_available', 'prolog_available', '_last_code_hash', '_lock')
+
+    def __init__(self, warm_up: bool = True):
+        self.janus_available = None  # Both stay None until warm_up() has run
+        self.prolog_available = None
+        self._last_code_hash = None  # Hash of the code currently consulted into temp_rules
+        self._lock = threading.Lock()  # Serializes consults and queries across threads
+        if warm_up:
+            self.warm_up()
+
+    def warm_up(self):
+        """Import and initialize SWI-Prolog (slow on first use, safe to call from a worker thread)"""
+        janus = _get_janus()
+        self.janus_available = janus is not None
+        if not self.janus_available:
             self.prolog_available = False
+            return
+
+        try:
+            # Initialize janus_swi
+            janus.query_once("writeln('Prolog available!')")
+            self.prolog_available = True
+        except Exception as e:
+            print(f"Error initializing janus_swi: {e}")
+            self.prolog_available = False
+            self.janus_available = False
+
+    def _consult(self, prolog_code: str):
+        """Consult code into temp_rules unless that exact code is already loaded"""
+        code_hash = hash(prolog_code)
+        if code_hash != self._last_code_hash:
+            self._last_code_hash = None
+            # Load Prolog code from string using consult with data parameter
+            _get_janus().consult("temp_rules", prolog_code)
+            self._last_code_hash = code_hash
+
+    def invalidate(self):
+        """Forget which code is consulted so the next test consults again"""
+        with self._lock:
+            self._last_code_hash = None
+
+    def preload(self, prolog_code: str):
+        """Consult code ahead of time so a later run_queries only has to query"""
+        if not self.prolog_available:
+            return
+
+        with self._lock:
+            try:
+                self._consult(prolog_code)
+            except Exception:
+                pass  # Errors are reported when the code is actually tested
 
     def run_queries(self, prolog_code: str, queries: List[Query]) -> Tuple[GameResult, Dict[str, Any]]:
         """Run Prolog queries using janus_swi"""
@@ -325,36 +492,40 @@ class JanusPrologRunner:
             return GameResult.PROLOG_ERROR, {
                 "error": "Janus SWI-Prolog not available. Install with: pip install janus_swi"}
 
+        with self._lock:
+            return self._run_queries(prolog_code, queries)
+
+    def _run_queries(self, prolog_code: str, queries: List[Query]) -> Tuple[GameResult, Dict[str, Any]]:
+        janus = _get_janus()
         try:
-            # Load Prolog code from string using consult with data parameter
-            janus.consult("temp_rules", prolog_code)
+            self._consult(prolog_code)
 
-            results = {}
+            results = []
             all_correct = True
+            solutions_by_goal = {}  # Goals shared by several queries are only run once
 
-            for i, query in enumerate(queries):
+            for query in queries:
                 try:
                     # Execute query and collect all solutions
                     actual_results = []
-                    found_solutions = False
-
-                    # Use janus query functions
-                    for solution in janus.query(query.query):
-                        found_solutions = True
-                        if solution:
-                            # Extract variable bindings
-                            if isinstance(solution, dict) and solution:
-                                # For queries with variables, collect ONLY the variable values
-                                for var, value in solution.items():
-                                    # Skip boolean indicators and None values, only collect actual variable values
-                                    if value not in [True, False, 'True', 'False', None, 'None'] and str(value) not in [
-                                        'True', 'False', 'None']:
-                                        actual_results.append(str(value))
-                            elif not isinstance(solution, dict):
-                                # For non-dict results, only add if it's not a boolean indicator or None
-                                if (solution not in [True, False, 'True', 'False', None, 'None'] and
-                                        str(solution) not in ['True', 'False', 'None']):
-                                    actual_results.append(str(solution))
+
+                    # Use janus query functions; all solutions share one shape,
+                    # so dispatch on the first one
+                    solutions = solutions_by_goal.get(query.query)
+                    if solutions is None:
+                        solutions = solutions_by_goal[query.query] = list(janus.query(query.query))
+                    found_solutions = bool(solutions)
+
+                    if found_solutions:
+                        if isinstance(solutions[0], dict):
+                            # For queries with variables, collect ONLY the variable values,
+                            # skipping boolean indicators and None values
+                            actual_results.extend(str(value) for solution in solutions
+                                                  for value in solution.values() if _is_binding(value))
+                        else:
+                            # For non-dict results, only add if it's not a boolean indicator or None
+                            actual_results.extend(str(solution) for solution in solutions
+                                                  if solution and _is_binding(solution))
 
                     # If we found solutions but no actual_results were collected,
                     # this might be a boolean query that succeeded
@@ -369,58 +540,100 @@ class JanusPrologRunner:
                             result = janus.query_once(query.query)
                             if result is not None:
                                 if isinstance(result, dict) and result:
-                                    # Extract variable values from the single result
-                                    for var, value in result.items():
-                                        # Skip boolean indicators
-                                        if value not in [True, False, 'True', 'False', None, 'None']:
-                                            actual_results.append(str(value))
+                                    # Extract variable values from the single result, skipping boolean indicators
+                                    actual_results.extend(str(value) for value in result.values()
+                                                          if _is_binding(value))
                                 elif result is True:
                                     # Only add "true" for pure boolean queries with no variables
-                                    if not any(c.isupper() for c in query.query):  # Simple heuristic for no variables
+                                    if not query._has_vars:
                                         actual_results.append("true")
                         except:
                             pass  # Query failed, actual_results remains empty
 
                     # Handle expected results comparison
-                    if not query.expected or query.expected == ['false']:  # Expected to fail
+                    if query._expects_failure:  # Expected to fail
                         correct = len(actual_results) == 0
                     else:
-                        # Compare with expected results
-                        expected_set = set(str(e) for e in query.expected)
-                        actual_set = set(str(r) for r in actual_results)
-                        correct = actual_set == expected_set
-
-                    results[f"query_{i}"] = {
-                        "query": query.query,
-                        "expected": query.expected,
-                        "actual": actual_results,
-                        "correct": correct
-                    }
+                        # Compare with expected results (actual results are already strings)
+                        correct = frozenset(actual_results) == query._expected_set
+
+                    results.append(QueryResult(query.query, query.expected, actual_results, correct))
 
                     if not correct:
                         all_correct = False
 
                 except Exception as e:
-                    results[f"query_{i}"] = {
-                        "query": query.query,
-                        "expected": query.expected,
-                        "actual": [],
-                        "error": str(e),
-                        "correct": False
-                    }
+                    results.append(QueryResult(query.query, query.expected, [], False, str(e)))
                     all_correct = False
 
             if all_correct:
-                return GameResult.SUCCESS, results
+                return GameResult.SUCCESS, {"queries": results}
             else:
-                return GameResult.WRONG_RESULTS, results
+                return GameResult.WRONG_RESULTS, {"queries": results}
 
         except Exception as e:
             return GameResult.PROLOG_ERROR, {"error": f"Prolog error: {str(e)}"}
 
+class PrologWorker:
+    """Runs submitted jobs one at a time on a single daemon thread"""
+
+    __slots__ = ('_jobs', '_thread')
+
+    def __init__(self, name: str = "prolog"):
+        self._jobs = queue.Queue()
+        # A daemon thread, so a query that never terminates cannot keep the process alive on exit
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args) -> Future:
+        """Queue fn(*args) and return a Future for its result"""
+        future = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+    def shutdown(self):
+        """Cancel jobs that have not started and stop the thread once the running one returns"""
+        try:
+            while True:
+                job = self._jobs.get_nowait()
+                if job is not None:
+                    job[0].cancel()
+        except queue.Empty:
+            pass
+        self._jobs.put(None)
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, fn, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
 class LawMakerGUI:
     """Solarpunk-themed GUI for the Law Maker game"""
 
+    __slots__ = ('root', 'style', 'levels_directory', 'levels', 'current_level_index', 'current_level',
+                 '_facts_prefix', '_level_key', '_consult_after', '_last_tested_key', '_last_render', '_result_cache',
+                 '_ui_queue', '_prolog_executor', 'prolog_runner', 'attempts_remaining', 'notebook',
+                 'level_frame', 'problem_frame', 'editor_frame', 'results_frame', 'level_listbox',
+                 'status_label', 'problem_title', 'problem_notebook', '_queries_tab', '_hints_tab',
+                 '_rendered_queries_text', '_rendered_hints_text', 'story_text', 'facts_text', 'law_text',
+                 'queries_text', 'hints_text', 'cheat_sheet_text', 'attempts_label', 'code_text',
+                 'test_button', 'prolog_status', 'results_text')
+
+    # Attempt indicators, indexed by the number of attempts remaining
+    _HEARTS = tuple("💚" * r + "💔" * (3 - r) for r in range(4))
+    _GREEN_HEARTS = tuple("💚" * r for r in range(4))
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Law Maker")
@@ -428,16 +641,34 @@ class LawMakerGUI:
 
         # Apply Solarpunk theme
         self.style = SolarpunkTheme.configure_style()
-        self.root.configure(bg=SolarpunkTheme.COLORS['bg_primary'])
+        self.root.configure(bg=SolarpunkTheme.COLORS.bg_primary)
 
         # Game state
         self.levels_directory = "levels"
         self.levels = []
         self.current_level_index = 0
         self.current_level = None
-        self.prolog_runner = JanusPrologRunner()
+        self._facts_prefix = ""
+        self._level_key = None
+        self._consult_after = None
+        self._last_tested_key = None
+        self._last_render = None
+        self._rendered_queries_text = None
+        self._rendered_hints_text = None
+        self._result_cache = OrderedDict()  # (level id, level key, code digest) -> (result, details)
+        self.prolog_runner = JanusPrologRunner(warm_up=False)
         self.attempts_remaining = 3
 
+        # Worker threads hand results to Tk through this queue
+        self._ui_queue = queue.Queue()
+
+        # All Prolog work runs on one persistent worker thread
+        self._prolog_executor = PrologWorker("prolog")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Start Prolog while the widgets are being built
+        self._prolog_executor.submit(self._warm_prolog)
+
         # Load levels
         self.load_levels()
 
@@ -447,13 +678,45 @@ class LawMakerGUI:
         # Load first level
         if self.levels:
             self.load_level(0)
+        else:
+            self.show_no_levels_status()
+
+        self._pump_ui_queue()
+
+    def _post_to_ui(self, callback, *args):
+        """Schedule a callback on the Tk main thread (safe to call from any thread)"""
+        self._ui_queue.put((callback, args))
+
+    def _pump_ui_queue(self):
+        """Run callbacks posted by worker threads, polling every 50 ms"""
+        try:
+            while True:
+                callback, args = self._ui_queue.get_nowait()
+                callback(*args)
+        except queue.Empty:
+            pass
+        finally:
+            self.root.after(50, self._pump_ui_queue)
+
+    def _warm_prolog(self):
+        """Initialize the Prolog runner in the background"""
+        self.prolog_runner.warm_up()
+        self._post_to_ui(self._on_prolog_ready)
+
+    def _on_prolog_ready(self):
+        """Enable testing once Prolog has finished starting up"""
+        self.update_prolog_status()
+        self.test_button.config(state=tk.NORMAL)
 
     def load_levels(self):
         """Load levels from directory"""
         self.levels = LevelLoader.load_levels_from_directory(self.levels_directory)
-        if not self.levels:
-            messagebox.showerror("Error", "No levels could be loaded!")
-            self.root.quit()
+
+    def show_no_levels_status(self):
+        """Report a missing level database inline instead of in a blocking dialog"""
+        self.status_label.config(
+            text=f"⚠️ No levels loaded — drop JSON files into ./{self.levels_directory} and press Refresh Database",
+            foreground=SolarpunkTheme.COLORS.warning)
 
     def setup_gui(self):
         """Setup the Solarpunk-themed GUI components"""
@@ -495,12 +758,13 @@ class LawMakerGUI:
 
     def create_styled_text(self, parent, **kwargs):
         """Create a text widget with Solarpunk styling"""
+        C = SolarpunkTheme.COLORS
         text_widget = scrolledtext.ScrolledText(
             parent,
-            bg=SolarpunkTheme.COLORS['bg_input'],
-            fg=SolarpunkTheme.COLORS['text_primary'],
-            insertbackground=SolarpunkTheme.COLORS['accent_tertiary'],
-            selectbackground=SolarpunkTheme.COLORS['accent_primary'],
+            bg=C.bg_input,
+            fg=C.text_primary,
+            insertbackground=C.accent_tertiary,
+            selectbackground=C.accent_primary,
             relief='sunken',
             borderwidth=2,
             **kwargs
@@ -528,10 +792,10 @@ class LawMakerGUI:
             list_frame,
             height=12,
             font=('Consolas', 11),
-            bg=SolarpunkTheme.COLORS['bg_input'],
-            fg=SolarpunkTheme.COLORS['text_primary'],
-            selectbackground=SolarpunkTheme.COLORS['accent_tertiary'],
-            selectforeground=SolarpunkTheme.COLORS['text_primary'],
+            bg=SolarpunkTheme.COLORS.bg_input,
+            fg=SolarpunkTheme.COLORS.text_primary,
+            selectbackground=SolarpunkTheme.COLORS.accent_tertiary,
+            selectforeground=SolarpunkTheme.COLORS.text_primary,
             relief='sunken',
             borderwidth=2
         )
@@ -560,42 +824,43 @@ class LawMakerGUI:
         self.problem_title.pack(pady=10)
 
         # Create sub-notebook for different sections
-        problem_notebook = ttk.Notebook(self.problem_frame, style='Solarpunk.TNotebook')
-        problem_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.problem_notebook = ttk.Notebook(self.problem_frame, style='Solarpunk.TNotebook')
+        self.problem_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.problem_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Background story tab
-        story_frame = ttk.Frame(problem_notebook, style='Solarpunk.TFrame')
-        problem_notebook.add(story_frame, text="🌿 Background")
+        story_frame = ttk.Frame(self.problem_notebook, style='Solarpunk.TFrame')
+        self.problem_notebook.add(story_frame, text="🌿 Background")
         self.story_text = self.create_styled_text(story_frame, state=tk.DISABLED, height=12)
         self.story_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Given facts tab
-        facts_frame = ttk.Frame(problem_notebook, style='Solarpunk.TFrame')
-        problem_notebook.add(facts_frame, text="📊 Database Facts")
+        facts_frame = ttk.Frame(self.problem_notebook, style='Solarpunk.TFrame')
+        self.problem_notebook.add(facts_frame, text="📊 Database Facts")
         self.facts_text = self.create_styled_text(facts_frame, state=tk.DISABLED, height=12, font=('Consolas', 10))
         self.facts_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Law description tab
-        law_frame = ttk.Frame(problem_notebook, style='Solarpunk.TFrame')
-        problem_notebook.add(law_frame, text="⚖️ Legal Requirements")
+        law_frame = ttk.Frame(self.problem_notebook, style='Solarpunk.TFrame')
+        self.problem_notebook.add(law_frame, text="⚖️ Legal Requirements")
         self.law_text = self.create_styled_text(law_frame, state=tk.DISABLED, height=12)
         self.law_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Queries tab
-        queries_frame = ttk.Frame(problem_notebook, style='Solarpunk.TFrame')
-        problem_notebook.add(queries_frame, text="🧪 Test Specs")
-        self.queries_text = self.create_styled_text(queries_frame, state=tk.DISABLED, height=12)
+        self._queries_tab = ttk.Frame(self.problem_notebook, style='Solarpunk.TFrame')
+        self.problem_notebook.add(self._queries_tab, text="🧪 Test Specs")
+        self.queries_text = self.create_styled_text(self._queries_tab, state=tk.DISABLED, height=12)
         self.queries_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Hints tab
-        hints_frame = ttk.Frame(problem_notebook, style='Solarpunk.TFrame')
-        problem_notebook.add(hints_frame, text="💡 Hints")
-        self.hints_text = self.create_styled_text(hints_frame, state=tk.DISABLED, height=12)
+        self._hints_tab = ttk.Frame(self.problem_notebook, style='Solarpunk.TFrame')
+        self.problem_notebook.add(self._hints_tab, text="💡 Hints")
+        self.hints_text = self.create_styled_text(self._hints_tab, state=tk.DISABLED, height=12)
         self.hints_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Solutions tab
-        cheat_sheet_frame = ttk.Frame(problem_notebook, style='Solarpunk.TFrame')
-        problem_notebook.add(cheat_sheet_frame, text="📄 Cheatsheet")
+        cheat_sheet_frame = ttk.Frame(self.problem_notebook, style='Solarpunk.TFrame')
+        self.problem_notebook.add(cheat_sheet_frame, text="📄 Cheatsheet")
         self.cheat_sheet_text = self.create_styled_text(cheat_sheet_frame, state=tk.DISABLED, height=12)
         self.cheat_sheet_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
@@ -614,13 +879,15 @@ class LawMakerGUI:
         # Code editor with enhanced styling
         self.code_text = self.create_styled_text(self.editor_frame, height=18)
         self.code_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.code_text.bind('<KeyRelease>', self._schedule_consult)
 
         # Buttons
         button_frame = ttk.Frame(self.editor_frame, style='Solarpunk.TFrame')
         button_frame.pack(fill=tk.X, padx=10, pady=10)
 
         self.test_button = ttk.Button(button_frame, text="🔬 Test Implementation",
-                                      command=self.test_solution, style='Solarpunk.TButton')
+                                      command=self.test_solution, style='Solarpunk.TButton',
+                                      state=tk.DISABLED)  # Enabled once Prolog is warmed up
         self.test_button.pack(side=tk.LEFT, padx=5)
 
         ttk.Button(button_frame, text="🗑️ Clear Code",
@@ -653,11 +920,10 @@ class LawMakerGUI:
 
     def populate_level_list(self):
         """Populate the level selection list"""
+        items = [f"Mission {i + 1}: {level.title} {_DIFF_ICONS[max(0, min(level.difficulty, 5))]}"
+                 for i, level in enumerate(self.levels)]
         self.level_listbox.delete(0, tk.END)
-        for i, level in enumerate(self.levels):
-            difficulty_icons = "☀️" * level.difficulty
-            self.level_listbox.insert(tk.END,
-                                      f"Mission {i + 1}: {level.title} {difficulty_icons}")
+        self.level_listbox.insert(tk.END, *items)
 
     def on_level_select(self, event=None):
         """Handle level selection"""
@@ -672,7 +938,16 @@ class LawMakerGUI:
         if 0 <= level_index < len(self.levels):
             self.current_level_index = level_index
             self.current_level = self.levels[level_index]
+            self._facts_prefix = self.current_level.given_facts + '\n'
+            # Covers everything a result depends on besides the user's code, so
+            # results cached before an edited level file was refreshed are not reused
+            self._level_key = hash((self._facts_prefix,
+                                    tuple((q.query, q._expected_set, q._expects_failure)
+                                          for q in self.current_level.queries)))
             self.attempts_remaining = 3
+            self._prolog_executor.submit(self.prolog_runner.invalidate)
+            self._last_tested_key = None
+            self._last_render = None
 
             # Update problem description
             self.problem_title.config(text=f"Mission {level_index + 1}: {self.current_level.title}")
@@ -682,32 +957,15 @@ class LawMakerGUI:
             self.update_text_widget(self.facts_text, self.current_level.given_facts)
             self.update_text_widget(self.law_text, self.current_level.law_description)
 
-            # Update queries display
-            queries_text = "🧪 Test Specifications (your code must satisfy these):\n\n"
-            for i, query in enumerate(self.current_level.queries, 1):
-                queries_text += f"{i}. Query: {query.query}\n"
-                queries_text += f"   Expected: {query.expected if query.expected else 'Should fail'}\n"
-                if query.description:
-                    queries_text += f"   📝 {query.description}\n"
-                queries_text += "\n"
-
-            self.update_text_widget(self.queries_text, queries_text)
-
-            # Update hints
-            if self.current_level.hints:
-                hints_text = "💡 Hints from the fedi-net:\n\n"
-                for i, hint in enumerate(self.current_level.hints, 1):
-                    hints_text += f"{i}. {hint}\n"
-            else:
-                hints_text = "No hints available."
-
-            self.update_text_widget(self.hints_text, hints_text)
+            # Queries and hints are rendered when their tab is first shown
+            self._rendered_queries_text = None
+            self._rendered_hints_text = None
+            self._on_tab_changed()
 
             # Update cheat sheet
             if self.current_level.solution:
-                cheat_sheet_text = "📄 Cheat Sheet (Solution)\n\n"
-                for solution in self.current_level.solution:
-                    cheat_sheet_text += f"{solution}\n"
+                cheat_sheet_text = "📄 Cheat Sheet (Solution)\n\n" + "".join(
+                    f"{solution}\n" for solution in self.current_level.solution)
             else:
                 cheat_sheet_text = "No solution available."
 
@@ -721,24 +979,71 @@ class LawMakerGUI:
             self.update_attempts_display()
             self.status_label.config(text=f"🌱 Mission {level_index + 1} loaded: {self.current_level.title}")
 
+    def _on_tab_changed(self, event=None):
+        """Render the queries or hints tab for the current level the first time it is shown"""
+        if not self.current_level:
+            return
+
+        selected = self.problem_notebook.select()
+        if selected == str(self._queries_tab) and self._rendered_queries_text is None:
+            self._rendered_queries_text = self.render_queries_text()
+            self.update_text_widget(self.queries_text, self._rendered_queries_text)
+        elif selected == str(self._hints_tab) and self._rendered_hints_text is None:
+            self._rendered_hints_text = self.render_hints_text()
+            self.update_text_widget(self.hints_text, self._rendered_hints_text)
+
+    def render_queries_text(self) -> str:
+        """Build the test specification text for the current level"""
+        parts = ["🧪 Test Specifications (your code must satisfy these):\n\n"]
+        for i, query in enumerate(self.current_level.queries, 1):
+            parts.append(f"{i}. Query: {query.query}\n")
+            parts.append(f"   Expected: {query.expected if query.expected else 'Should fail'}\n")
+            if query.description:
+                parts.append(f"   📝 {query.description}\n")
+            parts.append("\n")
+        return "".join(parts)
+
+    def render_hints_text(self) -> str:
+        """Build the hints text for the current level"""
+        if not self.current_level.hints:
+            return "No hints available."
+        return "💡 Hints from the fedi-net:\n\n" + "".join(
+            f"{i}. {hint}\n" for i, hint in enumerate(self.current_level.hints, 1))
+
     def update_text_widget(self, widget, text):
         """Update a text widget with new content"""
         widget.config(state=tk.NORMAL)
-        widget.delete(1.0, tk.END)
-        widget.insert(1.0, text)
+        widget.replace(1.0, tk.END, text)
         widget.config(state=tk.DISABLED)
 
     def update_attempts_display(self):
         """Update the attempts remaining display"""
-        hearts = "💚" * self.attempts_remaining + "💔" * (3 - self.attempts_remaining)
-        self.attempts_label.config(text=f"Attempts: {hearts}")
+        self.attempts_label.config(text=f"Attempts: {self._HEARTS[self.attempts_remaining]}")
 
     def update_prolog_status(self):
         """Update the Prolog availability status"""
         if self.prolog_runner.prolog_available:
-            self.prolog_status.config(text="⚡ Janus Prolog Online", foreground=SolarpunkTheme.COLORS['success'])
+            self.prolog_status.config(text="⚡ Janus Prolog Online", foreground=SolarpunkTheme.COLORS.success)
+        elif self.prolog_runner.prolog_available is None:
+            self.prolog_status.config(text="⏳ Checking Prolog...", foreground=SolarpunkTheme.COLORS.text_secondary)
         else:
-            self.prolog_status.config(text="⚠️ Prolog Offline", foreground=SolarpunkTheme.COLORS['warning'])
+            self.prolog_status.config(text="⚠️ Prolog Offline", foreground=SolarpunkTheme.COLORS.warning)
+
+    def _schedule_consult(self, event=None):
+        """Consult the editor code in the background once typing pauses"""
+        if self._consult_after is not None:
+            self.root.after_cancel(self._consult_after)
+        self._consult_after = self.root.after(750, self._bg_consult)
+
+    def _bg_consult(self):
+        """Preload the current editor code into Prolog on a worker thread"""
+        self._consult_after = None
+        if not self.current_level or not self.prolog_runner.prolog_available:
+            return
+
+        user_code = self.code_text.get(1.0, tk.END).strip()
+        if user_code:
+            self._prolog_executor.submit(self.prolog_runner.preload, self._facts_prefix + user_code)
 
     def test_solution(self):
         """Test the user's solution with enhanced feedback"""
@@ -755,115 +1060,131 @@ class LawMakerGUI:
             messagebox.showwarning("Warning", "⚡ Please enter some Prolog code in the forge!")
             return
 
+        # Combine given facts with user code
+        full_code = self._facts_prefix + user_code
+
+        # Identical code for the same level gives identical results, so reuse them.
+        # The level key is computed once per level, so only the user's code is hashed on each click.
+        cache_key = (self.current_level.id, self._level_key,
+                     hashlib.sha1(user_code.encode()).digest())
+
+        # Testing the exact same code again just shows the last report; no attempt is used up
+        if cache_key == self._last_tested_key and self._last_render is not None:
+            self.show_report(*self._last_render)
+            return
+
+        self._last_tested_key = cache_key
+        self._last_render = None
+        cached = self._result_cache.get(cache_key)
+        if cached:
+            self._result_cache.move_to_end(cache_key)
+            self.display_test_results(*cached)
+            return
+
         # Disable test button during testing
         self.test_button.config(state=tk.DISABLED)
-        self.test_button.config(text="🔬 Analyzing...")
+        self.test_button.config(text=f"🔬 {GUI_TEXT['analyzing']}")
 
-        # Run test in separate thread to avoid freezing GUI
-        def run_test():
-            try:
-                # Combine given facts with user code
-                full_code = self.current_level.given_facts + '\n' + user_code
-                result, details = self.prolog_runner.run_queries(full_code, self.current_level.queries)
+        # Run test on the Prolog worker to avoid freezing GUI
+        future = self._prolog_executor.submit(self.prolog_runner.run_queries, full_code, self.current_level.queries)
+        future.add_done_callback(lambda f: self._post_to_ui(self._handle_future, f, cache_key))
 
-                # Update GUI in main thread
-                self.root.after(0, lambda: self.display_test_results(result, details))
-            except Exception as e:
-                self.root.after(0, lambda: self.display_error(str(e)))
+    def _handle_future(self, future: Future, cache_key: Tuple[str, int, bytes]):
+        """Hand the worker's results to the GUI (runs on the Tk main thread)"""
+        try:
+            result, details = future.result()
+        except Exception as e:
+            self.display_error(str(e))
+            return
+
+        self._result_cache[cache_key] = (result, details)
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
-        threading.Thread(target=run_test, daemon=True).start()
+        self.display_test_results(result, details)
 
     def display_test_results(self, result: GameResult, details: Dict):
         """Display test results with Solarpunk styling"""
         self.test_button.config(state=tk.NORMAL, text="🔬 Test Implementation")
 
-        results_text = f"🔍 LEGAL COMPLIANCE REPORT 🔍\n"
-        results_text += f"{'=' * 50}\n"
-        results_text += f"Mission: {self.current_level.title}\n"
-        results_text += f"Attempt: {4 - self.attempts_remaining}/3\n"
-        results_text += f"{'=' * 50}\n\n"
+        report = ReportBuilder()
+        report.add("🔍 LEGAL COMPLIANCE REPORT 🔍\n", "header")
+        report.add(f"{_RULE}\n")
+        report.add(f"Mission: {self.current_level.title}\n", "header")
+        report.add(f"Attempt: {4 - self.attempts_remaining}/3\n"
+                   f"{_RULE}\n\n")
 
         if result == GameResult.SUCCESS:
-            results_text += "🎉 MISSION ACCOMPLISHED! 🎉\n"
-            results_text += "Your legal implementation passes all compliance tests!\n"
-            results_text += "🌱 The citizens of Solarfurt thank you for your service! 🌱\n\n"
+            report.add("🎉 MISSION ACCOMPLISHED! 🎉\n", "success")
+            report.add("Your legal implementation passes all compliance tests!\n"
+                       "🌱 The citizens of Solarfurt thank you for your service! 🌱\n\n")
 
             # Show detailed results
-            for query_id, query_result in details.items():
-                if query_id.startswith('query_'):
-                    results_text += f"✅ Query: {query_result['query']}\n"
-                    results_text += f"   Expected: {query_result['expected'] if query_result['expected'] else 'Should fail'}\n"
-                    results_text += f"   Got: {query_result['actual']}\n\n"
+            for query_result in details['queries']:
+                report.add(f"✅ Query: {query_result.query}\n", "success")
+                report.add(f"   Expected: {query_result.expected if query_result.expected else 'Should fail'}\n")
+                report.add(f"   Got: {query_result.actual}\n\n")
 
             # Level completed
             messagebox.showinfo("🎉 Success!",
                                 f"Mission {self.current_level_index + 1} completed!\n\n🌿 Your Prolog implementation correctly satisfies all legal requirements.\n\nGood job!")
 
         elif result == GameResult.PROLOG_ERROR:
-            results_text += "⚠️ SYSTEM ERROR ⚠️\n"
-            results_text += f"The rusty-futuristic compiler encountered an issue:\n"
-            results_text += f"{details.get('error', 'Unknown error')}\n\n"
-            results_text += "🔧 Check your syntax and try again, legal engineer!\n"
+            report.add("⚠️ SYSTEM ERROR ⚠️\n", "error")
+            report.add("The rusty-futuristic compiler encountered an issue:\n"
+                       f"{details.get('error', 'Unknown error')}\n\n"
+                       "🔧 Check your syntax and try again, legal engineer!\n")
 
         elif result == GameResult.WRONG_RESULTS:
-            results_text += "❌ COMPLIANCE VIOLATIONS DETECTED ❌\n\n"
+            report.add("❌ COMPLIANCE VIOLATIONS DETECTED ❌\n\n", "error")
 
-            for query_id, query_result in details.items():
-                if query_id.startswith('query_'):
-                    if query_result['correct']:
-                        results_text += f"✅ Query: {query_result['query']}\n"
-                    else:
-                        results_text += f"❌ Query: {query_result['query']}\n"
+            for query_result in details['queries']:
+                if query_result.correct:
+                    report.add(f"✅ Query: {query_result.query}\n", "success")
+                else:
+                    report.add(f"❌ Query: {query_result.query}\n", "error")
 
-                    results_text += f"   Expected: {query_result['expected'] if query_result['expected'] else 'Should fail'}\n"
-                    results_text += f"   Got: {query_result['actual']}\n"
+                report.add(f"   Expected: {query_result.expected if query_result.expected else 'Should fail'}\n")
+                report.add(f"   Got: {query_result.actual}\n")
 
-                    if 'error' in query_result and query_result['error']:
-                        results_text += f"   Error: {query_result['error']}\n"
+                if query_result.error:
+                    report.add(f"   Error: {query_result.error}\n")
 
-                    results_text += "\n"
+                report.add("\n")
 
         # Update attempts
         self.attempts_remaining -= 1
         self.update_attempts_display()
 
         if result != GameResult.SUCCESS and self.attempts_remaining == 0:
-            results_text += f"\n💔 OUT OF ATTEMPTS! 💔\n"
-            results_text += "Mission failed, but you can try other missions or reload this one.\n"
-            results_text += "🌿 Learn from this experience, young legal engineer! 🌿\n"
+            report.add("\n💔 OUT OF ATTEMPTS! 💔\n"
+                       "Mission failed, but you can try other missions or reload this one.\n"
+                       "🌿 Learn from this experience, young legal engineer! 🌿\n")
         elif result != GameResult.SUCCESS and self.attempts_remaining > 0:
-            hearts = "💚" * self.attempts_remaining
-            results_text += f"\n⚡ Try again! {hearts} attempts remaining.\n"
+            report.add(f"\n⚡ Try again! {self._GREEN_HEARTS[self.attempts_remaining]} attempts remaining.\n")
 
             # Show hints after first failure
             if self.attempts_remaining == 2 and self.current_level.hints:
-                results_text += "\n💡 You can browse the fedi-net for hints:\n"
+                report.add("\n💡 You can browse the fedi-net for hints:\n")
                 for i, hint in enumerate(self.current_level.hints, 1):
-                    results_text += f"{i}. {hint}\n"
+                    report.add(f"{i}. {hint}\n")
 
+        self._last_render = (report.text(), report.tags)
+        self.show_report(*self._last_render)
+
+    def show_report(self, results_text: str, tags: List[Tuple[int, str]]):
+        """Show a compliance report in the results tab, coloring the given (line, tag) pairs"""
         # Display results with enhanced styling
         self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(1.0, results_text)
+        self.results_text.replace(1.0, tk.END, results_text)
 
         # Add some color coding
-        self.results_text.tag_configure("success", foreground=SolarpunkTheme.COLORS['success'])
-        self.results_text.tag_configure("error", foreground=SolarpunkTheme.COLORS['warning'])
-        self.results_text.tag_configure("header", foreground=SolarpunkTheme.COLORS['accent_secondary'])
-
-        # Apply tags
-        content = self.results_text.get(1.0, tk.END)
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            line_start = f"{i + 1}.0"
-            line_end = f"{i + 1}.end"
-
-            if "✅" in line or "ACCOMPLISHED" in line or "SUCCESS" in line:
-                self.results_text.tag_add("success", line_start, line_end)
-            elif "❌" in line or "ERROR" in line or "VIOLATIONS" in line:
-                self.results_text.tag_add("error", line_start, line_end)
-            elif "REPORT" in line or "Mission:" in line:
-                self.results_text.tag_add("header", line_start, line_end)
+        self.results_text.tag_configure("success", foreground=SolarpunkTheme.COLORS.success)
+        self.results_text.tag_configure("error", foreground=SolarpunkTheme.COLORS.warning)
+        self.results_text.tag_configure("header", foreground=SolarpunkTheme.COLORS.accent_secondary)
+
+        for line, tag in tags:
+            self.results_text.tag_add(tag, f"{line}.0", f"{line}.end")
 
         self.results_text.config(state=tk.DISABLED)
 
@@ -878,6 +1199,7 @@ class LawMakerGUI:
     def clear_code(self):
         """Clear the code editor"""
         self.code_text.delete(1.0, tk.END)
+        self._prolog_executor.submit(self.prolog_runner.invalidate)
 
     def clear_results(self):
         """Clear the results panel"""
@@ -925,21 +1247,35 @@ subsidy_amount(Person, Amount) :-
     def refresh_levels(self):
         """Refresh levels from current directory"""
         try:
+            # A level counts as updated if its file is new or was re-parsed at a different mtime
+            previous = LevelLoader.cached_mtimes(self.levels_directory)
             self.levels = LevelLoader.load_levels_from_directory(self.levels_directory)
+            changed = sum(previous.get(path) != mtime
+                          for path, mtime in LevelLoader.cached_mtimes(self.levels_directory).items())
+
             self.populate_level_list()
-            self.status_label.config(text=f"🔄 Refreshed {len(self.levels)} missions from database")
+            if not self.levels:
+                self.show_no_levels_status()
+                return
+            self.status_label.config(text=f"🔄 Refreshed {len(self.levels)} missions from database "
+                                          f"({changed} updated)",
+                                     foreground=SolarpunkTheme.COLORS.text_primary)
 
             # Reload current level if it still exists
-            if (self.current_level and
-                    self.current_level_index < len(self.levels) and
-                    self.levels[self.current_level_index].id == self.current_level.id):
-                self.load_level(self.current_level_index)
-            elif self.levels:
+            index_by_id = {level.id: i for i, level in enumerate(self.levels)}
+            if self.current_level and self.current_level.id in index_by_id:
+                self.load_level(index_by_id[self.current_level.id])
+            else:
                 self.load_level(0)
 
         except Exception as e:
             messagebox.showerror("Error", f"🔧 Failed to refresh legal database:\n{e}")
 
+    def on_close(self):
+        """Stop the Prolog worker and close the window"""
+        self._prolog_executor.shutdown()
+        self.root.destroy()
+
     def run(self):
         """Start the Solarpunk GUI application"""
 
@@ -963,11 +1299,8 @@ subsidy_amount(Person, Amount) :-
             # Try to load and display the cityscape image
             try:
                 if os.path.exists("sprites/cityscape-background-illustration.jpg"):
-                    # Load and resize the image
-                    image = Image.open("sprites/cityscape-background-illustration.jpg")
-                    # Resize to fit nicely in the dialog
-                    image = image.resize((800, 400), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
+                    # Load and resize the image to fit nicely in the dialog
+                    photo = _load_photo("sprites/cityscape-background-illustration.jpg", (800, 400))
 
                     # Image label
                     img_label = tk.Label(main_frame, image=photo, bg='#2d5016')
@@ -1017,11 +1350,8 @@ subsidy_amount(Person, Amount) :-
             # Try to load and display the Pocket-Inferer image
             try:
                 if os.path.exists("sprites/pocket-inferer.jpg"):
-                    # Load and resize the Pocket-Inferer image
-                    pocket_image = Image.open("sprites/pocket-inferer.jpg")
-                    # Resize to fit nicely on the right side
-                    pocket_image = pocket_image.resize((300, 350), Image.Resampling.LANCZOS)
-                    pocket_photo = ImageTk.PhotoImage(pocket_image)
+                    # Load and resize the Pocket-Inferer image to fit nicely on the right side
+                    pocket_photo = _load_photo("sprites/pocket-inferer.jpg", (300, 350))
 
                     # Label for the device
                     tk.Label(device_frame, text="The Pocket-Inferer",
@@ -1034,9 +1364,7 @@ subsidy_amount(Person, Amount) :-
 
                 elif os.path.exists("sprites/pocket-inferer.png"):
                     # Try PNG format as fallback
-                    pocket_image = Image.open("sprites/pocket-inferer.png")
-                    pocket_image = pocket_image.resize((300, 350), Image.Resampling.LANCZOS)
-                    pocket_photo = ImageTk.PhotoImage(pocket_image)
+                    pocket_photo = _load_photo("sprites/pocket-inferer.png", (300, 350))
 
                     tk.Label(device_frame, text="The Pocket-Inferer",
                              font=('Arial', 12, 'bold'), bg='#2d5016', fg='#90EE90').pack(pady=(0, 10))
@@ -1093,14 +1421,9 @@ subsidy_amount(Person, Amount) :-
         # Start the main loop
         self.root.mainloop()
 
-def create_sample_levels():
-    """Create sample level files in the levels directory"""
-    levels_dir = "levels"
-    LevelLoader.create_sample_levels(levels_dir)
-    print(f"🌱 Sample legal missions created in '{levels_dir}' directory")
 
-    # Create a Solarpunk-themed README
-    readme_content = """# 🌱 Solarfurt Legal System - Mission Database 🔋
+# README written alongside freshly created sample levels
+_README_BYTES = """# 🌱 Solarfurt Legal System - Mission Database 🔋
 
 Welcome to the legal code repository for the sustainable city-state of Solarfurt!
 
@@ -1145,10 +1468,25 @@ Each legal mission is stored as a JSON file with eco-friendly metadata:
 - ⚖️ Ensure legal logic is sound and fair
 
 *Powered by renewable Prolog energy since 2024* 🌱
-"""
+""".encode("utf-8")
 
-    with open(os.path.join(levels_dir, "README.md"), 'w') as f:
-        f.write(readme_content)
+
+def create_sample_levels():
+    """Create sample level files in the levels directory"""
+    levels_dir = "levels"
+    LevelLoader.create_sample_levels(levels_dir)
+    print(f"🌱 Sample legal missions created in '{levels_dir}' directory")
+
+    # Create a Solarpunk-themed README, unless an identical one is already there
+    readme_path = os.path.join(levels_dir, "README.md")
+    if os.path.exists(readme_path) and os.path.getsize(readme_path) == len(_README_BYTES):
+        # Sizes match, so only now is it worth reading the file to compare
+        with open(readme_path, 'rb') as f:
+            if f.read() == _README_BYTES:
+                return
+
+    with open(readme_path, 'wb') as f:
+        f.write(_README_BYTES)
 
 
 def main():
@@ -1160,12 +1498,6 @@ def main():
         print("🔧 Setting up legal database...")
         create_sample_levels()
 
-    # Check for janus_swi
-    if not JANUS_AVAILABLE:
-        print("⚠️  Warning: janus_swi not available!")
-        print("🔧 For optimal performance, install with: pip install janus_swi")
-        print("⚡ The system will still work, but with limited Prolog integration.")
-
     # Start the Solarpunk GUI
     try:
         print("🌿 Launching rusty-futuristic interface...")